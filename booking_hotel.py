@@ -1,28 +1,224 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
+from functools import lru_cache
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import json
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+import io
 import os
-from ttkthemes import ThemedTk
+import re
+import sqlite3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data):
+    # orjson gives bytes, decoded so both paths store the same TEXT values
+    return orjson.dumps(data).decode() if orjson else json.dumps(data)
+
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# ReportLab is only needed when a PDF is made, so it is imported on first use
+@lru_cache(maxsize=None)
+def _stylesheet():
+    """Sample stylesheet plus CustomTitle, shared by every receipt"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30
+    ))
+    return styles
+
+@lru_cache(maxsize=None)
+def _receipt_styles():
+    """Checkout receipt styles, built once and shared by every receipt"""
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import TableStyle
+    
+    styles = _stylesheet()
+    col_widths = (2*inch, 4*inch)
+    receipt_table_style = TableStyle([
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
+        ('FONTSIZE', (0,0), (-1,-1), 10),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+    ])
+    charges_table_style = TableStyle([
+        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+        ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,-1), 12),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 12),
+        ('LINEABOVE', (0,-1), (-1,-1), 1, colors.black),
+        ('LINEBELOW', (0,-1), (-1,-1), 1, colors.black),
+    ])
+    return styles, col_widths, receipt_table_style, charges_table_style
+
+def _draw_invoice(c, room):
+    """Draw the booking invoice of an occupied room on the current page of canvas c"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    
+    # The invoice always fits on one page, so it is laid out by hand instead of through platypus
+    # Dated by the check-in, so a reprint carries the same date and number as the invoice from the booking
+    issued = room.checkin_time
+    x_label, x_value, x_right = inch, 3*inch, letter[0] - inch
+    line = 22
+    y = letter[1] - inch - 24
+    
+    # Header
+    c.setFont('Helvetica-Bold', 24)
+    c.drawString(x_label, y, "Hotel CG")
+    y -= 40
+    c.setFont('Helvetica-Bold', 14)
+    c.drawString(x_label, y, f"{room.room_type} Room Invoice")
+    y -= 40
+    
+    # Invoice details
+    invoice_data = [
+        ['Tanggal Faktur:', _fmt_display(issued)],
+        ['Nomor Faktur:', f'INV-{room.room_number}-{issued.strftime("%Y%m%d%H%M")}'],
+        ['Nomor Kamar:', room.room_number],
+        ['Jenis Kamar:', room.room_type],
+        ['Fasilitas:', room.amenities_str]
+    ]
+    
+    # Blocks are marked by a few rules instead of per-cell borders
+    c.setLineWidth(0.25)
+    c.setStrokeColor(colors.grey)
+    c.line(x_label, y + 16, x_right, y + 16)
+    
+    c.setFont('Helvetica', 10)
+    for label, value in invoice_data:
+        c.drawString(x_label, y, label)
+        c.drawString(x_value, y, str(value))
+        y -= line
+    c.line(x_label, y + 16, x_right, y + 16)
+    y -= 20
+    
+    # Pricing details
+    base_price = room.price * room.nights
+    total_price = room.calculate_price()
+    additional_charges = total_price - base_price
+    
+    pricing_data = [
+        ['Base Price:', _fmt_rp(base_price)],
+        ['Additional Charges:', _fmt_rp(additional_charges)],
+        ['Total Price:', _fmt_rp(total_price)]
+    ]
+    
+    top = y + 16
+    c.setFont('Helvetica-Bold', 10)
+    for label, value in pricing_data:
+        c.drawString(x_label, y, label)
+        c.drawString(x_value, y, value)
+        y -= line
+    c.rect(x_label - 6, y + 16, x_right - x_label + 12, top - y - 16, stroke=1, fill=0)
+
+def render_invoices(rooms, output):
+    """Render one PDF with an invoice per room"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+    
+    c = canvas.Canvas(output, pagesize=letter)
+    for room in rooms:
+        _draw_invoice(c, room)
+        c.showPage()
+    c.save()
+
+def _fmt_rp(value, _format='Rp{:,.2f}'.format):
+    """Rupiah amount as shown across the app, e.g. Rp1,250,000.00"""
+    if value % 1 == 0:
+        # Whole rupiah amounts are the common case and skip float formatting
+        return f'Rp{int(value):,}.00'
+    return _format(value)
+
+# Check-ins are stored as 2024-01-31 14:05:09 and shown as 2024-01-31 14:05, both laid
+# out by hand since strftime parses its format string on every call
+def _fmt_checkin(dt):
+    return f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}'
+
+def _fmt_display(dt):
+    return f'{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}'
+
+def _parse_checkin(text):
+    """Inverse of _fmt_checkin, fromisoformat reads that layout without strptime's regex"""
+    return datetime.fromisoformat(text)
+
+# Separator of the extra amenities typed in the admin form
+_AMEN_SPLIT = re.compile(r'\s*,\s*')
+
+def _write_atomic(filename, data):
+    """Write data in a single call, then move it into place so readers never see a partial file"""
+    tmp = filename + '.tmp'
+    with open(tmp, 'wb') as file:
+        file.write(data)
+    os.replace(tmp, filename)
 
 # Base Room Class
 class Room:
+    __slots__ = ('room_number', 'price', '_extra_amenities', 'max_occupancy', 'is_available',
+                 '_checkin_time', '_checkin_iso', '_checkin_display', 'nights', 'guest_name',
+                 '_price_cache', '_amenities_str', '_admin')
+    # Rows of an unknown type load as a plain Room, which still needs a type for the indexes
+    room_type = "Room"
+    DEFAULT_AMENITIES = ()
+
     def __init__(self, room_number, price, amenities=None, max_occupancy=2, 
                  is_available=True, checkin_time=None, nights=0, guest_name=""):
         self.room_number = room_number
         self.price = price
-        self.amenities = amenities or []
+        self._extra_amenities = list(amenities or [])
         self.max_occupancy = max_occupancy
         self.is_available = is_available
-        self.checkin_time = datetime.strptime(checkin_time, '%Y-%m-%d %H:%M:%S') if checkin_time else None
+        # Parsed on first access, most loaded rooms are only ever displayed or saved
+        self._checkin_time = None
+        self._checkin_iso = checkin_time or None
+        self._checkin_display = checkin_time[:16] if checkin_time else "-"
         self.nights = nights
         self.guest_name = guest_name
+        self._price_cache = None
+        self._amenities_str = None
+        self._admin = None
+
+    @property
+    def amenities(self):
+        """Built-in amenities of the room type followed by the extra ones"""
+        return list(self.DEFAULT_AMENITIES) + self._extra_amenities
+
+    @property
+    def amenities_str(self):
+        """Amenities joined for display, rebuilt only after the extra amenities change"""
+        if self._amenities_str is None:
+            self._amenities_str = ', '.join(self.amenities)
+        return self._amenities_str
+
+    @property
+    def checkin_time(self):
+        if self._checkin_time is None and self._checkin_iso:
+            self._checkin_time = _parse_checkin(self._checkin_iso)
+        return self._checkin_time
+
+    @checkin_time.setter
+    def checkin_time(self, value):
+        # Format once here so to_dict and the views never have to
+        self._checkin_time = value
+        self._checkin_iso = _fmt_checkin(value) if value else None
+        self._checkin_display = _fmt_display(value) if value else "-"
+
+    @property
+    def checkin_display(self):
+        return self._checkin_display
 
     def book_room(self, nights, guest_name):
         if self.is_available:
@@ -30,16 +226,29 @@ class Room:
             self.checkin_time = datetime.now()
             self.nights = nights
             self.guest_name = guest_name
+            # Priced once per stay, the checkout view, dialog and receipt all reuse it
+            self._price_cache = self._compute_price()
+            if self._admin:
+                self._admin.notify_booked(self)
             return True
         return False
 
     def release_room(self):
+        if self._admin and not self.is_available:
+            self._admin.notify_released(self)
         self.is_available = True
         self.checkin_time = None
         self.nights = 0
         self.guest_name = ""
+        self._price_cache = None
         
     def calculate_price(self):
+        """Total price for the current stay, fixed when the room is booked"""
+        if self._price_cache is None:
+            self._price_cache = self._compute_price()
+        return self._price_cache
+
+    def _compute_price(self):
         """Base price calculation method"""
         return self.price * self.nights
 
@@ -48,10 +257,10 @@ class Room:
             'room_number': self.room_number,
             'room_type': self.__class__.__name__,
             'price': self.price,
-            'amenities': self.amenities,
+            'amenities': self._extra_amenities,
             'max_occupancy': self.max_occupancy,
             'is_available': self.is_available,
-            'checkin_time': self.checkin_time.strftime('%Y-%m-%d %H:%M:%S') if self.checkin_time else None,
+            'checkin_time': self._checkin_iso,
             'nights': self.nights,
             'guest_name': self.guest_name
         }
@@ -64,50 +273,59 @@ class Room:
             'SuiteRoom': SuiteRoom
         }
         room_class = room_types.get(data['room_type'], Room)
+        # Older files also stored the built-in amenities, don't add them twice
+        amenities = [a for a in data.get('amenities', []) if a not in room_class.DEFAULT_AMENITIES]
         return room_class(
             room_number=data['room_number'],
             price=data['price'],
-            amenities=data.get('amenities', []),
+            amenities=amenities,
             max_occupancy=data.get('max_occupancy', 2),
             is_available=data['is_available'],
             checkin_time=data['checkin_time'],
-            nights=data['nights']
+            nights=data['nights'],
+            guest_name=data.get('guest_name', '')
         )
 
 # Inherited Room Classes
 class StandardRoom(Room):
+    __slots__ = ()
+    room_type = "Standard"
+    DEFAULT_AMENITIES = ('TV', 'AC', 'WiFi')
+
     def __init__(self, room_number, price, **kwargs):
         super().__init__(room_number, price, **kwargs)
-        self.amenities.extend(['TV', 'AC', 'WiFi'])
-        self.room_type = "Standard"
         self.max_occupancy = 2
 
-    def calculate_price(self):
+    def _compute_price(self):
         """Override price calculation for standard room"""
-        base_price = super().calculate_price()
+        base_price = super()._compute_price()
         # No additional charges for standard room
         return base_price
 
 class DeluxeRoom(Room):
+    __slots__ = ()
+    room_type = "Deluxe"
+    DEFAULT_AMENITIES = ('TV', 'AC', 'WiFi', 'Mini Bar', 'City View')
+
     def __init__(self, room_number, price, **kwargs):
         super().__init__(room_number, price, **kwargs)
-        self.amenities.extend(['TV', 'AC', 'WiFi', 'Mini Bar', 'City View'])
-        self.room_type = "Deluxe"
         self.max_occupancy = 3
 
-    def calculate_price(self):
+    def _compute_price(self):
         """Override price calculation for deluxe room"""
-        base_price = super().calculate_price()
+        base_price = super()._compute_price()
         # Add 10% service charge for deluxe rooms
         service_charge = base_price * 0.10
         return base_price + service_charge
 
 class SuiteRoom(Room):
+    __slots__ = ()
+    room_type = "Suite"
+    DEFAULT_AMENITIES = ('TV', 'AC', 'WiFi', 'Mini Bar', 'City View',
+                         'Living Room', 'Kitchen', 'Jacuzzi')
+
     def __init__(self, room_number, price, **kwargs):
         super().__init__(room_number, price, **kwargs)
-        self.amenities.extend(['TV', 'AC', 'WiFi', 'Mini Bar', 'City View', 
-                             'Living Room', 'Kitchen', 'Jacuzzi'])
-        self.room_type = "Suite"
         self.max_occupancy = 4
         
     def book_room(self, nights, guest_name):
@@ -120,12 +338,13 @@ class SuiteRoom(Room):
     
     def arrange_vip_welcome(self):
         """Special method for suite rooms"""
-        self.amenities.append('Welcome Champagne')
-        self.amenities.append('Fruit Basket')
+        self._extra_amenities.append('Welcome Champagne')
+        self._extra_amenities.append('Fruit Basket')
+        self._amenities_str = None
 
-    def calculate_price(self):
+    def _compute_price(self):
         """Override price calculation for suite room"""
-        base_price = super().calculate_price()
+        base_price = super()._compute_price()
         # Add 15% service charge and additional amenities fee
         service_charge = base_price * 0.15
         amenities_fee = 500000  # Fixed fee for extra amenities
@@ -135,6 +354,16 @@ class SuiteRoom(Room):
 class Admin:
     def __init__(self):
         self.rooms = []
+        self._by_number = {}
+        # room_type -> {room_number: room}, a dict keeps the rooms in insertion order
+        self._by_type = defaultdict(dict)
+        # Same layout for available rooms only, kept up to date by notify_booked/notify_released
+        self._available_all = {}
+        self._available_by_type = defaultdict(dict)
+        self._occupied = 0
+        self._revenue = 0.0
+        # Numbers of rooms added, removed, booked or released since the last save
+        self._dirty = set()
 
     def add_room(self, room_type, room_number, price, **kwargs):
         room_classes = {
@@ -145,24 +374,88 @@ class Admin:
         
         room_class = room_classes.get(room_type)
         if room_class:
+            # Checked before anything is stored, the indexes are keyed by the number
+            try:
+                number = int(room_number)
+            except ValueError:
+                raise ValueError("Nomor kamar harus berupa angka.") from None
+            if number in self._by_number:
+                raise ValueError(f"Kamar {room_number} sudah ada.")
             room = room_class(room_number, price, **kwargs)
             self.rooms.append(room)
+            self._track(room)
+            self._dirty.add(number)
             return True
         return False
 
+    def _track(self, room):
+        room._admin = self
+        self._by_number[int(room.room_number)] = room
+        self._by_type[room.room_type][int(room.room_number)] = room
+        if room.is_available:
+            self._available_all[int(room.room_number)] = room
+            self._available_by_type[room.room_type][int(room.room_number)] = room
+        else:
+            self.notify_booked(room)
+
     def remove_room(self, room_number):
-        self.rooms = [room for room in self.rooms if room.room_number != room_number]
+        room = self._by_number.pop(int(room_number), None)
+        if room:
+            if not room.is_available:
+                self.notify_released(room)
+            del self._available_all[int(room_number)]
+            del self._available_by_type[room.room_type][int(room_number)]
+            room._admin = None
+            self._dirty.add(int(room_number))
+            self.rooms.remove(room)
+            rooms_of_type = self._by_type[room.room_type]
+            del rooms_of_type[int(room_number)]
+            if not rooms_of_type:
+                del self._by_type[room.room_type]
+
+    def notify_booked(self, room):
+        """Called by a room once it becomes occupied"""
+        self._occupied += 1
+        self._revenue += room.price * room.nights
+        self._available_all.pop(int(room.room_number), None)
+        self._available_by_type[room.room_type].pop(int(room.room_number), None)
+        self._dirty.add(int(room.room_number))
+
+    def notify_released(self, room):
+        """Called by a room right before it is released"""
+        self._occupied -= 1
+        self._revenue -= room.price * room.nights
+        self._available_all[int(room.room_number)] = room
+        self._available_by_type[room.room_type][int(room.room_number)] = room
+        self._dirty.add(int(room.room_number))
+        if not self._occupied:
+            # Drop any float drift left over from the running sum
+            self._revenue = 0.0
+
+    def pop_dirty(self):
+        """Room numbers changed since the last call, handing them over to the caller"""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def restore_dirty(self, room_numbers):
+        """Hand back numbers from pop_dirty whose save failed, so the next save includes them"""
+        self._dirty |= room_numbers
 
     def get_room_by_number(self, room_number):
-        for room in self.rooms:
-            if int(room.room_number) == int(room_number):
-                return room
-        return None
+        return self._by_number.get(int(room_number))
+
+    def get_room_types(self):
+        return sorted(self._by_type)
+
+    def iter_available(self, room_type=None):
+        """Available rooms by room number, optionally only those of one room type"""
+        rooms = self._available_all if room_type is None else self._available_by_type.get(room_type, {})
+        return [rooms[room_number] for room_number in sorted(rooms)]
 
     def get_booking_statistics(self):
         total_rooms = len(self.rooms)
-        occupied_rooms = len([room for room in self.rooms if not room.is_available])
-        total_revenue = sum([room.price * room.nights for room in self.rooms if not room.is_available])
+        occupied_rooms = self._occupied
+        total_revenue = self._revenue
         return {
             'total_rooms': total_rooms,
             'occupied_rooms': occupied_rooms,
@@ -178,8 +471,132 @@ class Admin:
     def from_dict(data):
         admin = Admin()
         admin.rooms = [Room.from_dict(room) for room in data]
+        for room in admin.rooms:
+            admin._track(room)
+        # Loaded rooms match what is stored
+        admin._dirty.clear()
         return admin
 
+class RoomStore:
+    """Rooms kept in SQLite, one row per room, so saving only writes the rooms that changed"""
+    def __init__(self, path="rooms.db", legacy_path="rooms.json"):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS rooms (room_number INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+        # Room numbers from rooms.json that could not be migrated, for the app to report
+        self.skipped = []
+        # user_version marks the migration as done, so removing every room later doesn't bring rooms.json back
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            if self.conn.execute("SELECT 1 FROM rooms LIMIT 1").fetchone() is None:
+                self._import_json(legacy_path)
+            self.conn.execute("PRAGMA user_version = 1")
+
+    def _import_json(self, legacy_path):
+        """One-time migration of the rooms.json used by earlier versions"""
+        try:
+            with open(legacy_path, "rb") as file:
+                data = _loads(file.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        # Earlier versions accepted any room number, rows that can't be keyed or repeat a number are left out
+        rows = {}
+        for room in data:
+            try:
+                number = int(room['room_number'])
+            except (KeyError, TypeError, ValueError):
+                self.skipped.append(str(room.get('room_number')))
+                continue
+            if number in rows:
+                self.skipped.append(str(room['room_number']))
+                continue
+            rows[number] = _dumps(room)
+        with self.conn:
+            self.conn.executemany("INSERT INTO rooms VALUES (?, ?)", rows.items())
+
+    def load(self):
+        # Rows are decoded one at a time as Admin.from_dict consumes them
+        rows = self.conn.execute("SELECT data FROM rooms ORDER BY room_number")
+        return Admin.from_dict(_loads(data) for (data,) in rows)
+
+    def save(self, rooms, removed=()):
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO rooms VALUES (?, ?)",
+                                  [(int(room.room_number), _dumps(room.to_dict())) for room in rooms])
+            self.conn.executemany("DELETE FROM rooms WHERE room_number = ?",
+                                  [(int(room_number),) for room_number in removed])
+
+    def close(self):
+        self.conn.close()
+
+def _build_receipt_story(room, checkout_time, total_cost):
+    """Flowables for one checkout receipt"""
+    from reportlab.platypus import Paragraph, Spacer, Table
+    
+    styles, col_widths, receipt_table_style, charges_table_style = _receipt_styles()
+    checkout_display = _fmt_display(checkout_time)
+    
+    elements = []
+    
+    # Header
+    elements.append(Paragraph("Hotel CG", styles['CustomTitle']))
+    elements.append(Paragraph("Checkout Receipt", styles['Heading2']))
+    elements.append(Spacer(1, 20))
+    
+    # Receipt details
+    receipt_data = [
+        ['Receipt Number:', f'RCP-{room.room_number}-{checkout_time.strftime("%Y%m%d%H%M")}'],
+        ['Checkout Date:', checkout_display],
+        ['Room Number:', room.room_number],
+        ['Room Type:', room.room_type],
+        ['Guest Name:', room.guest_name],
+        ['Check-in:', room.checkin_display],
+        ['Check-out:', checkout_display],
+        ['Duration:', f'{room.nights} nights'],
+        ['Base Rate:', f'{_fmt_rp(room.price)} per night'],
+    ]
+    
+    t = Table(receipt_data, colWidths=col_widths)
+    t.setStyle(receipt_table_style)
+    elements.append(t)
+    elements.append(Spacer(1, 20))
+    
+    # Charges breakdown
+    base_price = room.price * room.nights
+    additional_charges = total_cost - base_price
+    
+    charges_data = [
+        ['Base Charges:', _fmt_rp(base_price)],
+        ['Additional Charges:', _fmt_rp(additional_charges)],
+        ['Total Amount:', _fmt_rp(total_cost)]
+    ]
+    
+    t = Table(charges_data, colWidths=col_widths)
+    t.setStyle(charges_table_style)
+    elements.append(t)
+    
+    # Thank you message
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("Thank you for staying at Hotel CG!", styles['Heading3']))
+    elements.append(Paragraph("We hope to see you again soon.", styles['Normal']))
+    return elements
+
+# PDF workers run in a separate process, so they take plain room dicts rather than Room objects
+def _render_receipt_worker(room_dict, checkout_time, total_cost, filename):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate
+    
+    room = Room.from_dict(room_dict)
+    # Build PDF in memory, then write it out in one go
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter).build(_build_receipt_story(room, checkout_time, total_cost))
+    _write_atomic(filename, buffer.getvalue())
+
+def _render_invoice_worker(room_dicts, filename):
+    buffer = io.BytesIO()
+    render_invoices([Room.from_dict(room_dict) for room_dict in room_dicts], buffer)
+    _write_atomic(filename, buffer.getvalue())
+
 class ModernHotelBookingApp:
     def __init__(self, root):
         self.root = root
@@ -213,7 +630,25 @@ class ModernHotelBookingApp:
                    foreground=[('active', 'white')])
         
         # Admin instance
-        self.admin = self.load_rooms_from_json()
+        self.store = RoomStore()
+        self.admin = self.store.load()
+        if self.store.skipped:
+            messagebox.showwarning(
+                "Peringatan",
+                "Kamar berikut dari rooms.json tidak dipindahkan karena nomornya bukan angka atau ganda: "
+                f"{', '.join(self.store.skipped)}. Data aslinya tetap ada di rooms.json."
+            )
+        
+        # Rooms the admin marked as changed are written in one go shortly after the last mutation
+        self._flush_scheduled = False
+        
+        os.makedirs('receipts', exist_ok=True)
+        os.makedirs('invoices', exist_ok=True)
+        
+        # PDFs are rendered in worker processes, spawned rather than forked from the Tk process
+        # A couple of workers cover one PDF per click with room for a receipt and an invoice together
+        self._pdf_pool = ProcessPoolExecutor(max_workers=2,
+                                             mp_context=multiprocessing.get_context('spawn'))
         
         # Create main container
         self.main_container = ttk.Frame(self.root)
@@ -226,6 +661,12 @@ class ModernHotelBookingApp:
         self.content_frame = ttk.Frame(self.main_container)
         self.content_frame.pack(fill=tk.BOTH, expand=True, pady=20)
         
+        # Every panel is built once and swapped in, plus room_number -> (iid, values) per tree
+        self._views = {}
+        self._current_view = None
+        self._checkout_tree_items = {}
+        self._admin_tree_items = {}
+        
         # Start with main menu
         self.show_main_menu()
         
@@ -251,10 +692,22 @@ class ModernHotelBookingApp:
                   style='Primary.TButton',
                   command=self.show_main_menu).pack(side=tk.LEFT, padx=5)
 
+    def show_view(self, name, build):
+        """Swap the content area to the named view, building it on first use"""
+        if self._current_view is not None:
+            self._current_view.pack_forget()
+        if name not in self._views:
+            self._views[name] = build()
+        self._current_view = self._views[name]
+        self._current_view.pack(fill=tk.BOTH, expand=True)
+
     def show_main_menu(self):
-        self.clear_content()
+        self.show_view('main', self.build_main_menu)
+
+    def build_main_menu(self):
+        view = ttk.Frame(self.content_frame)
         
-        menu_frame = ttk.Frame(self.content_frame)
+        menu_frame = ttk.Frame(view)
         menu_frame.pack(expand=True)
         
         # Welcome message
@@ -280,70 +733,68 @@ class ModernHotelBookingApp:
             text="Customer Checkout",
             style='Primary.TButton',
             command=self.show_customer_checkout).pack(pady=10)
+        
+        return view
 
     def show_admin_panel(self):
-        self.clear_content()
-        
-        admin_frame = ttk.Frame(self.content_frame)
-        admin_frame.pack(fill=tk.BOTH, expand=True)
+        self.show_view('admin', self.build_admin_panel)
+        self._refresh_stats()
+
+    def build_admin_panel(self):
+        view = ttk.Frame(self.content_frame)
         
         # Statistics section
-        self.show_statistics(admin_frame)
+        self.build_statistics(view)
         
         # Room management section
-        self.show_room_management(admin_frame)
+        self.show_room_management(view)
+        
+        return view
 
-    def show_statistics(self, parent_frame):
+    def build_statistics(self, parent_frame):
         stats_frame = ttk.LabelFrame(parent_frame, text="Statistik Hotel")
         stats_frame.pack(fill=tk.X, pady=10, padx=5)
         
-        stats = self.admin.get_booking_statistics()
-        
-        # Create grid of statistics
-        labels = [
-            f"Jumlah Kamar: {stats['total_rooms']}",
-            f"Kamar Terpakai: {stats['occupied_rooms']}",
-            f"Kamar Tersedia: {stats['available_rooms']}",
-            f"Tingkat Hunian: {stats['occupancy_rate']:.1f}%",
-            f"Total Revenue: Rp{stats['total_revenue']:,.2f}"
-        ]
-        
-        for i, text in enumerate(labels):
+        # Create grid of statistics, each label follows its own variable set by _refresh_stats
+        self._stat_vars = {}
+        for i, key in enumerate(('total', 'occupied', 'available', 'rate', 'revenue')):
+            self._stat_vars[key] = tk.StringVar()
             ttk.Label(stats_frame,
-                     text=text,
+                     textvariable=self._stat_vars[key],
                      font=('Helvetica', 10)).grid(row=i//3,
                                                 column=i%3,
                                                 padx=10,
                                                 pady=5)
+
+    def _refresh_stats(self):
+        stats = self.admin.get_booking_statistics()
+        
+        self._stat_vars['total'].set(f"Jumlah Kamar: {stats['total_rooms']}")
+        self._stat_vars['occupied'].set(f"Kamar Terpakai: {stats['occupied_rooms']}")
+        self._stat_vars['available'].set(f"Kamar Tersedia: {stats['available_rooms']}")
+        self._stat_vars['rate'].set(f"Tingkat Hunian: {stats['occupancy_rate']:.1f}%")
+        self._stat_vars['revenue'].set(f"Total Revenue: {_fmt_rp(stats['total_revenue'])}")
+
     def show_customer_checkout(self):
-        self.clear_content()
+        self.show_view('checkout', self.build_checkout_view)
+        self.refresh_checkout_tree()
+
+    def build_checkout_view(self):
+        view = ttk.Frame(self.content_frame)
         
-        checkout_frame = ttk.Frame(self.content_frame)
+        checkout_frame = ttk.Frame(view)
         checkout_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview for occupied rooms
         columns = ('Nomor Kamar', 'Jenis', 'Tamu', 'Check-in', 'Malam', 'Total Biaya')
         tree = ttk.Treeview(checkout_frame, columns=columns, show='headings')
+        self.checkout_tree = tree
         
         # Set column headings
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=100)
         
-        # Add data for occupied rooms only
-        for room in self.admin.rooms:
-            if not room.is_available:
-                total_cost = room.calculate_price()
-                checkin = room.checkin_time.strftime('%Y-%m-%d %H:%M') if room.checkin_time else "-"
-                tree.insert('', tk.END, values=(
-                    room.room_number,
-                    room.room_type,
-                    room.guest_name,
-                    checkin,
-                    room.nights,
-                    f"Rp{total_cost:,.2f}"
-                ))
-        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(checkout_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscrollcommand=scrollbar.set)
@@ -360,7 +811,6 @@ class ModernHotelBookingApp:
                 
             room_number = tree.item(selected_item)['values'][0]
             room = self.admin.get_room_by_number(room_number)
-            print(room)
             if room:
                 # Calculate final bill
                 total_cost = room.calculate_price()
@@ -373,10 +823,10 @@ class ModernHotelBookingApp:
                     f"Detail Checkout:\n\n"
                     f"Kamar: {room.room_number} ({room.room_type})\n"
                     f"Tamu: {room.guest_name}\n"
-                    f"Check-in: {room.checkin_time.strftime('%Y-%m-%d %H:%M')}\n"
-                    f"Check-out: {checkout_time.strftime('%Y-%m-%d %H:%M')}\n"
+                    f"Check-in: {room.checkin_display}\n"
+                    f"Check-out: {_fmt_display(checkout_time)}\n"
                     f"Durasi: {room.nights} malam\n"
-                    f"Total Biaya: Rp{total_cost:,.2f}\n\n"
+                    f"Total Biaya: {_fmt_rp(total_cost)}\n\n"
                     "Lanjutkan checkout?"
                 )
                 
@@ -386,98 +836,79 @@ class ModernHotelBookingApp:
                     
                     # Release the room
                     room.release_room()
+                    self._schedule_save()
                     
                     # Remove from treeview
-                    tree.delete(selected_item)
+                    self.refresh_checkout_tree()
                     
                     messagebox.showinfo("Success", "Checkout berhasil!")
         
         # Add checkout button
-        ttk.Button(self.content_frame,
+        ttk.Button(view,
                 text="Process Checkout",
                 style='Primary.TButton',
                 command=process_checkout).pack(pady=10)
         
         # Back button
-        ttk.Button(self.content_frame,
+        ttk.Button(view,
                 text="Kembali",
                 style='Primary.TButton',
                 command=self.show_main_menu).pack(pady=10)
+        
+        return view
+
+    def refresh_checkout_tree(self):
+        # Add data for occupied rooms only
+        rows = {}
+        for room in self.admin.rooms:
+            if not room.is_available:
+                total_cost = room.calculate_price()
+                rows[int(room.room_number)] = (
+                    room.room_number,
+                    room.room_type,
+                    room.guest_name,
+                    room.checkin_display,
+                    room.nights,
+                    _fmt_rp(total_cost)
+                )
+        self.sync_tree(self.checkout_tree, self._checkout_tree_items, rows)
+
+    def sync_tree(self, tree, items, rows):
+        """Bring tree in line with rows, only touching items whose values changed"""
+        stale = [key for key in items if key not in rows]
+        changed = [(key, values) for key, values in rows.items()
+                   if key not in items or items[key][1] != values]
+        if not stale and not changed:
+            return
+        
+        # Columns are hidden while rows change so the tree is laid out once at the end
+        tree.configure(displaycolumns=())
+        for key in stale:
+            tree.delete(items.pop(key)[0])
+        for key, values in changed:
+            item = items.get(key)
+            if item is None:
+                items[key] = (tree.insert('', tk.END, values=values), values)
+            else:
+                tree.item(item[0], values=values)
+                items[key] = (item[0], values)
+        tree.configure(displaycolumns='#all')
 
     def generate_checkout_receipt(self, room, checkout_time, total_cost):
-        if not os.path.exists('receipts'):
-            os.makedirs('receipts')
-            
         filename = f"receipts/Hotel_CG_Checkout_{room.room_number}_{checkout_time.strftime('%Y%m%d_%H%M%S')}.pdf"
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30
-        ))
-        
-        elements = []
-        
-        # Header
-        elements.append(Paragraph("Hotel CG", styles['CustomTitle']))
-        elements.append(Paragraph("Checkout Receipt", styles['Heading2']))
-        elements.append(Spacer(1, 20))
-        
-        # Receipt details
-        receipt_data = [
-            ['Receipt Number:', f'RCP-{room.room_number}-{checkout_time.strftime("%Y%m%d%H%M")}'],
-            ['Checkout Date:', checkout_time.strftime('%Y-%m-%d %H:%M')],
-            ['Room Number:', room.room_number],
-            ['Room Type:', room.room_type],
-            ['Guest Name:', room.guest_name],
-            ['Check-in:', room.checkin_time.strftime('%Y-%m-%d %H:%M')],
-            ['Check-out:', checkout_time.strftime('%Y-%m-%d %H:%M')],
-            ['Duration:', f'{room.nights} nights'],
-            ['Base Rate:', f'Rp{room.price:,.2f} per night'],
-        ]
-        
-        t = Table(receipt_data, colWidths=[2*inch, 4*inch])
-        t.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-        ]))
-        elements.append(t)
-        elements.append(Spacer(1, 20))
-        
-        # Charges breakdown
-        base_price = room.price * room.nights
-        additional_charges = total_cost - base_price
-        
-        charges_data = [
-            ['Base Charges:', f'Rp{base_price:,.2f}'],
-            ['Additional Charges:', f'Rp{additional_charges:,.2f}'],
-            ['Total Amount:', f'Rp{total_cost:,.2f}']
-        ]
-        
-        t = Table(charges_data, colWidths=[2*inch, 4*inch])
-        t.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 12),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-            ('LINEABOVE', (0,-1), (-1,-1), 1, colors.black),
-            ('LINEBELOW', (0,-1), (-1,-1), 1, colors.black),
-        ]))
-        elements.append(t)
-        
-        # Thank you message
-        elements.append(Spacer(1, 30))
-        elements.append(Paragraph("Thank you for staying at Hotel CG!", styles['Heading3']))
-        elements.append(Paragraph("We hope to see you again soon.", styles['Normal']))
-        
-        # Build PDF
-        doc.build(elements)
-        messagebox.showinfo("Receipt Generated", f"Checkout receipt has been saved to {filename}")
+        # The worker gets a snapshot, the room is released right after this returns
+        future = self._pdf_pool.submit(_render_receipt_worker, room.to_dict(), checkout_time, total_cost, filename)
+        self.notify_when_done(future, "Receipt Generated", f"Checkout receipt has been saved to {filename}")
+
+    def notify_when_done(self, future, title, message):
+        """Show message once future finishes, checking from the Tk thread"""
+        if not future.done():
+            self.root.after(50, self.notify_when_done, future, title, message)
+        elif future.exception():
+            messagebox.showerror("Error", str(future.exception()))
+        else:
+            messagebox.showinfo(title, message)
+
     def show_room_management(self, parent_frame):
         room_frame = ttk.LabelFrame(parent_frame, text="Manajemen Kamar")
         room_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
@@ -533,18 +964,25 @@ class ModernHotelBookingApp:
                   text="Lihat Kamar",
                   style='Primary.TButton',
                   command=self.view_rooms_admin).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(buttons_frame,
+                  text="Cetak Semua Faktur",
+                  style='Primary.TButton',
+                  command=self.print_all_invoices).pack(side=tk.LEFT, padx=5)
 
     def add_room(self):
         try:
-            room_number = self.room_entries['room_number'].get()
+            room_number = self.room_entries['room_number'].get().strip()
             price = float(self.room_entries['price'].get())
             room_type = self.room_type_var.get()
-            additional_amenities = [a.strip() for a in self.amenities_text.get("1.0", tk.END).split(',') if a.strip()]
+            additional_amenities = [a for a in _AMEN_SPLIT.split(self.amenities_text.get("1.0", tk.END).strip()) if a]
             
             if not all([room_number, price > 0, room_type]):
                 raise ValueError("All fields are required and must be valid.")
             
             if self.admin.add_room(room_type, room_number, price, amenities=additional_amenities):
+                self._schedule_save()
+                self._refresh_stats()
                 messagebox.showinfo("Success", f"Kamar {room_number} ({room_type}) sukses ditambahkan!")
                 
                 # Clear entries
@@ -559,14 +997,19 @@ class ModernHotelBookingApp:
 
 
     def view_rooms_admin(self):
-        self.clear_content()
+        self.show_view('rooms_admin', self.build_rooms_admin_view)
+        self.refresh_admin_tree()
+
+    def build_rooms_admin_view(self):
+        view = ttk.Frame(self.content_frame)
         
-        rooms_frame = ttk.Frame(self.content_frame)
+        rooms_frame = ttk.Frame(view)
         rooms_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview
         columns = ('Nomor Kamar', 'Jenis', 'Harga', 'Status', 'Tamu', 'Check-in', 'Fasilitas')
         tree = ttk.Treeview(rooms_frame, columns=columns, show='headings')
+        self.admin_tree = tree
         
         # Set column headings
         for col in columns:
@@ -576,20 +1019,6 @@ class ModernHotelBookingApp:
         # Adjust facilities column width
         tree.column('Fasilitas', width=200)
         
-        # Add data
-        for room in self.admin.rooms:
-            status = "Available" if room.is_available else "Occupied"
-            checkin = room.checkin_time.strftime('%Y-%m-%d %H:%M') if room.checkin_time else "-"
-            tree.insert('', tk.END, values=(
-                room.room_number,
-                room.room_type,
-                f"Rp{room.price:,.2f}",
-                status,
-                room.guest_name or "-",
-                checkin,
-                ', '.join(room.amenities)
-            ))
-        
         # Add scrollbar
         scrollbar = ttk.Scrollbar(rooms_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscrollcommand=scrollbar.set)
@@ -599,28 +1028,47 @@ class ModernHotelBookingApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Back button
-        ttk.Button(self.content_frame,
+        ttk.Button(view,
                   text="Kembali",
                   style='Primary.TButton',
                   command=self.show_admin_panel).pack(pady=10)
+        
+        return view
+
+    def refresh_admin_tree(self):
+        rows = {}
+        for room in self.admin.rooms:
+            status = "Available" if room.is_available else "Occupied"
+            rows[int(room.room_number)] = (
+                room.room_number,
+                room.room_type,
+                _fmt_rp(room.price),
+                status,
+                room.guest_name or "-",
+                room.checkin_display,
+                room.amenities_str
+            )
+        self.sync_tree(self.admin_tree, self._admin_tree_items, rows)
 
     def show_customer_panel(self):
-        self.clear_content()
+        self.show_view('customer', self.build_customer_panel)
         
-        customer_frame = ttk.Frame(self.content_frame)
-        customer_frame.pack(fill=tk.BOTH, expand=True)
+        # Room types may have changed since the last visit, the list follows the current filter
+        self.filter_combo.configure(values=["Semua"] + self.admin.get_room_types())
+        self.filter_rooms()
+
+    def build_customer_panel(self):
+        view = ttk.Frame(self.content_frame)
         
         # Search and filter section
-        filter_frame = ttk.LabelFrame(customer_frame, text="Search Rooms")
+        filter_frame = ttk.LabelFrame(view, text="Search Rooms")
         filter_frame.pack(fill=tk.X, pady=10, padx=5)
         
-        # Add filter options
+        # Add filter options, kept apart from the room type of the admin form
         ttk.Label(filter_frame, text="Jenis Kamar:").pack(side=tk.LEFT, padx=5)
-        room_types = list(set(room.room_type for room in self.admin.rooms))
-        self.room_type_var = tk.StringVar(value="Semua")
-        ttk.Combobox(filter_frame,
-                    textvariable=self.room_type_var,
-                    values=["Semua"] + room_types).pack(side=tk.LEFT, padx=5)
+        self.filter_type_var = tk.StringVar(value="Semua")
+        self.filter_combo = ttk.Combobox(filter_frame, textvariable=self.filter_type_var)
+        self.filter_combo.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(filter_frame,
                   text="Search",
@@ -628,73 +1076,68 @@ class ModernHotelBookingApp:
                   command=self.filter_rooms).pack(side=tk.LEFT, padx=5)
         
         # Available rooms section
+        self.build_available_rooms(view)
+        
+        return view
+
     def filter_rooms(self):
-        selected_type = self.room_type_var.get()
+        selected_type = self.filter_type_var.get()
         self.show_available_rooms(selected_type)
 
     def show_available_rooms(self, filter_type="Semua"):
-        # Clear previous room display
-        for widget in self.content_frame.winfo_children():
-            if isinstance(widget, ttk.LabelFrame):
-                widget.destroy()
-                
-        rooms_frame = ttk.LabelFrame(self.content_frame, text="Kamar yang Tersedia")
+        # A new filter only replaces the rows of the list
+        tree = self.available_tree
+        room_type = None if filter_type == "Semua" else filter_type
+        rows = [(
+            room.room_number,
+            room.room_type,
+            f"{_fmt_rp(room.price)} per night",
+            f"{room.max_occupancy} Orang",
+            room.amenities_str
+        ) for room in self.admin.iter_available(room_type)]
+        
+        # Display rooms with the columns hidden until all rows are in, the room number doubles as the row id
+        tree.configure(displaycolumns=())
+        tree.delete(*tree.get_children())
+        for values in rows:
+            tree.insert('', tk.END, iid=values[0], values=values)
+        tree.configure(displaycolumns='#all')
+
+    def build_available_rooms(self, parent_frame):
+        rooms_frame = ttk.LabelFrame(parent_frame, text="Kamar yang Tersedia")
         rooms_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
         
-        # Create canvas for scrolling
-        canvas = tk.Canvas(rooms_frame)
-        scrollbar = ttk.Scrollbar(rooms_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # One treeview row per room instead of a card of widgets per room
+        list_frame = ttk.Frame(rooms_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        columns = ('Nomor Kamar', 'Jenis', 'Harga', 'Maksimal Orang', 'Fasilitas')
+        tree = ttk.Treeview(list_frame, columns=columns, show='headings')
+        self.available_tree = tree
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100)
+        tree.column('Fasilitas', width=300)
         
-        # Display rooms
-        for room in self.admin.rooms:
-            if not room.is_available:
-                continue
-            if filter_type != "Semua" and room.room_type != filter_type:
-                continue
-                
-            room_card = ttk.LabelFrame(scrollable_frame, text=f"Kamar {room.room_number}")
-            room_card.pack(fill=tk.X, padx=5, pady=5)
-            
-            # Room details
-            details_frame = ttk.Frame(room_card)
-            details_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            ttk.Label(details_frame,
-                     text=f"Jenis: {room.room_type}",
-                     font=('Helvetica', 10, 'bold')).pack(anchor="w")
-            
-            ttk.Label(details_frame,
-                     text=f"Harga: Rp{room.price:,.2f} per night",
-                     font=('Helvetica', 10)).pack(anchor="w")
-            
-            ttk.Label(details_frame,
-                     text=f"Maksimal Orang: {room.max_occupancy} Orang",
-                     font=('Helvetica', 10)).pack(anchor="w")
-            
-            # Amenities
-            if room.amenities:
-                ttk.Label(details_frame,
-                         text="Fasilitas: " + ", ".join(room.amenities),
-                         font=('Helvetica', 10)).pack(anchor="w")
-            
-            # Book button
-            ttk.Button(details_frame,
-                      text="Booking Sekarang",
-                      style='Primary.TButton',
-                      command=lambda r=room: self.show_booking_form(r)).pack(pady=10)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
         
-        # Pack scrollbar and canvas
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        def book_selected():
+            selected_item = tree.selection()
+            if not selected_item:
+                messagebox.showerror("Error", "Pilih kamar untuk booking")
+                return
+            self.show_booking_form(self.admin.get_room_by_number(selected_item[0]))
+        
+        # Book button
+        ttk.Button(rooms_frame,
+                  text="Booking Sekarang",
+                  style='Primary.TButton',
+                  command=book_selected).pack(pady=10)
 
     def show_booking_form(self, room):
         booking_window = tk.Toplevel(self.root)
@@ -711,9 +1154,9 @@ class ModernHotelBookingApp:
         
         details_text = f"""
 Type: {room.room_type} Room
-Price per night: Rp{room.price:,.2f}
+Price per night: {_fmt_rp(room.price)}
 Maximum Occupancy: {room.max_occupancy} Persons
-Amenities: {', '.join(room.amenities)}
+Amenities: {room.amenities_str}
 """
         ttk.Label(form_frame,
                  text=details_text,
@@ -756,6 +1199,7 @@ Amenities: {', '.join(room.amenities)}
                     raise ValueError("Please fill in all required fields.")
                 
                 if room.book_room(nights, guest_name):
+                    self._schedule_save()
                     self.generate_modern_invoice(room, {
                         'guest_name': guest_name,
                         'email': email,
@@ -778,91 +1222,56 @@ Amenities: {', '.join(room.amenities)}
 
 
     def generate_modern_invoice(self, room, guest_details):
-        if not os.path.exists('invoices'):
-            os.makedirs('invoices')
-            
-        filename = f"invoices/Hotel_CG_Invoice_{room.room_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30
-        ))
-        
-        elements = []
-        
-        # Header
-        elements.append(Paragraph("Hotel CG", styles['CustomTitle']))
-        elements.append(Paragraph(f"{room.room_type} Room Invoice", styles['Heading2']))
-        elements.append(Spacer(1, 20))
-        
-        # Invoice details
-        invoice_data = [
-            ['Tanggal Faktur:', datetime.now().strftime('%Y-%m-%d %H:%M')],
-            ['Nomor Faktur:', f'INV-{room.room_number}-{datetime.now().strftime("%Y%m%d%H%M")}'],
-            ['Nomor Kamar:', room.room_number],
-            ['Jenis Kamar:', room.room_type],
-            ['Fasilitas:', ', '.join(room.amenities)]
-        ]
-        
-        t = Table(invoice_data, colWidths=[2*inch, 4*inch])
-        t.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (-1,-1), 'Helvetica'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-        ]))
-        elements.append(t)
-        elements.append(Spacer(1, 20))
-        
-        # Pricing details
-        base_price = room.price * room.nights
-        total_price = room.calculate_price()
-        additional_charges = total_price - base_price
-        
-        pricing_data = [
-            ['Base Price:', f'Rp{base_price:,.2f}'],
-            ['Additional Charges:', f'Rp{additional_charges:,.2f}'],
-            ['Total Price:', f'Rp{total_price:,.2f}']
-        ]
-        
-        t = Table(pricing_data, colWidths=[2*inch, 4*inch])
-        t.setStyle(TableStyle([
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('FONTNAME', (0,0), (-1,-1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,-1), 10),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 12),
-        ]))
-        elements.append(t)
-        
-        # Build PDF
-        doc.build(elements)
-        messagebox.showinfo("Faktur Generated", f"Faktur telah disimpan di {filename}")
+        # Named after the check-in, which also dates the invoice
+        filename = f"invoices/Hotel_CG_Invoice_{room.room_number}_{room.checkin_time.strftime('%Y%m%d_%H%M%S')}.pdf"
+        future = self._pdf_pool.submit(_render_invoice_worker, [room.to_dict()], filename)
+        self.notify_when_done(future, "Faktur Generated", f"Faktur telah disimpan di {filename}")
 
-    def clear_content(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def print_all_invoices(self):
+        occupied = [room for room in self.admin.rooms if not room.is_available]
+        if not occupied:
+            messagebox.showerror("Error", "Tidak ada kamar yang terpakai")
+            return
+        
+        # All invoices go through a single build, one page per room
+        filename = f"invoices/Hotel_CG_Invoices_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        future = self._pdf_pool.submit(_render_invoice_worker, [room.to_dict() for room in occupied], filename)
+        self.notify_when_done(future, "Faktur Generated", f"Faktur telah disimpan di {filename}")
 
-    def load_rooms_from_json(self):
-        try:
-            with open("rooms.json", "r") as file:
-                data = json.load(file)
-                return Admin.from_dict(data)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return Admin()
+    def _schedule_save(self):
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(500, self._flush)
 
-    def save_rooms_to_json(self):
-        with open("rooms.json", "w") as file:
-            json.dump(self.admin.to_dict(), file, indent=4)
+    def _flush(self):
+        self._flush_scheduled = False
+        dirty = self.admin.pop_dirty()
+        if dirty:
+            changed, removed = [], []
+            for room_number in dirty:
+                room = self.admin.get_room_by_number(room_number)
+                if room:
+                    changed.append(room)
+                else:
+                    removed.append(room_number)
+            try:
+                self.store.save(changed, removed)
+            except sqlite3.Error as e:
+                self.admin.restore_dirty(dirty)
+                messagebox.showerror("Error", f"Gagal menyimpan data kamar: {e}")
 
     def on_close(self):
-        self.save_rooms_to_json()
-        self.root.destroy()
+        self._pdf_pool.shutdown(wait=True)
+        # Only rooms changed since the last flush are written, nothing at all if none were
+        try:
+            self._flush()
+        finally:
+            self.store.close()
+            self.root.destroy()
 
 if __name__ == "__main__":
+    # Imported here so the PDF worker processes, which re-import this module, skip it
+    from ttkthemes import ThemedTk
     root = ThemedTk(theme="arc")  
     app = ModernHotelBookingApp(root)
     root.mainloop()
\ No newline at end of file